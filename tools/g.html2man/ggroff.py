@@ -1,7 +1,6 @@
 
 import sys
 import os
-import re
 
 __all__ = ["Formatter"]
 
@@ -69,7 +68,6 @@ class Formatter:
                           in_tr=False,
                           index=[])
         self.stack = []
-        self.strip_re = re.compile("^[ \t]+")
         self.filename = filename
         self.at_bol = True
 
@@ -101,19 +99,10 @@ class Formatter:
         self.pop()
 
     def fmt(self, format, content, var=None):
-        # String.partition is only in 2.5+
-        # (pre,sep,post) = format.partition("@")
         if self.get('no_nl') and '\n' in format:
             self.warning("can't handle line breaks in <dt>...</dt>")
             format = "@"
-        f = format.split('@', 1)
-        pre = f[0]
-        if len(f) > 1:
-            sep = '@'
-            post = f[1]
-        else:
-            sep = ''
-            post = ''
+        (pre, sep, post) = format.partition("@")
 
         if pre != "":
             self.show(pre)
@@ -189,7 +178,7 @@ class Formatter:
                 if tag in ['thead', 'tbody', 'tfoot']:
                     n = self.count_cols(body)
                 elif tag == 'tr':
-                    n = len(clean(body))
+                    n = sum(1 for cell in body if not is_blank(cell))
                 cols = max(cols, n)
             else:
                 self.warning("invalid item in table: %s" % str(item))
@@ -200,7 +189,7 @@ class Formatter:
         if cols == 0:
             return
         self.show("\n.TS\nexpand;\n")
-        self.show(" lw1 ".join(["lw60" for i in range(cols)]) + ".\n")
+        self.show(" lw1 ".join(["lw60"] * cols) + ".\n")
         self.pp_tbody(content)
         self.show("\n.TE\n")
 
@@ -244,18 +233,10 @@ class Formatter:
         self.show(s)
 
     def pp_text(self, content):
-        if content == "":
-            return
-        lines = content.splitlines(True)
-        if len(lines) != 1:
-            for line in lines:
-                self.pp_text(line)
-            return
-        else:
-            content = lines[0]
-        if self.at_bol and not self.get('preformat'):
-            content = self.strip_re.sub('', content)
-        self.pp_string(content)
+        for line in content.splitlines(True):
+            if self.at_bol and not self.get('preformat'):
+                line = line.lstrip(" \t")
+            self.pp_string(line)
 
     def pp_list(self, content):
         for item in content:
@@ -266,6 +247,9 @@ class Formatter:
             self.pp_list(content)
         elif is_tuple(content):
             (tag, attrs, body) = content
+            # skip ToC
+            if tag == 'div' and ('class', 'toc') in attrs:
+                return
             self.pp_tag(tag, body)
         elif is_string(content):
             self.pp_text(content)